@@ -1,4 +1,6 @@
 import os
+from functools import lru_cache
+
 from minio import Minio
 
 # Read from environment, don't import settings here to avoid circular dependency
@@ -8,8 +10,9 @@ MINIO_SECRET_KEY = os.getenv("MINIO_SECRET_KEY", "minioadmin")
 MINIO_USE_SSL = os.getenv("MINIO_USE_SSL", "False").lower() in ("true", "1", "yes")
 MINIO_BUCKET = os.getenv("MINIO_BUCKET", "documents")
 
+@lru_cache(maxsize=1)
 def get_minio_client():
-    """Returns a configured MinIO client instance."""
+    """Returns a shared MinIO client instance (one connection pool per process)."""
     return Minio(
         MINIO_ENDPOINT,
         access_key=MINIO_ACCESS_KEY,
@@ -10,6 +10,9 @@ from minio.error import S3Error
 
 from config.minio import get_minio_client, MINIO_BUCKET, MINIO_ENDPOINT, MINIO_USE_SSL, MINIO_ACCESS_KEY, MINIO_SECRET_KEY
 
+# Buckets already verified/created in this process, so new storage instances skip the round-trip
+_ensured_buckets = set()
+
 
 @deconstructible
 class MinioMediaStorage(Storage):
@@ -29,8 +32,11 @@ class MinioMediaStorage(Storage):
             self._ensure_bucket()
 
     def _ensure_bucket(self):
+        if self.bucket in _ensured_buckets:
+            return
         if not self.client.bucket_exists(self.bucket):
             self.client.make_bucket(self.bucket)
+        _ensured_buckets.add(self.bucket)
 
     def _open(self, name, mode="rb"):
         response = self.client.get_object(self.bucket, name)
@@ -1,11 +1,15 @@
 from split_settings.tools import include, optional
 import os
+import sys
 
-# Which environment to use
-ENV = os.environ.get("DJANGO_ENV") or "dev"
+# Test runs (`manage.py test` or pytest) default to the test profile
+RUNNING_TESTS = sys.argv[1:2] == ["test"] or "pytest" in sys.modules
+
+# Which environment to use (an explicit DJANGO_ENV always wins)
+ENV = os.environ.get("DJANGO_ENV") or ("test" if RUNNING_TESTS else "dev")
 
 # Load base + environment-specific settings
 include(
     "base.py",
-    optional(f"{ENV}.py"),  # loads dev.py or prod.py automatically
+    optional(f"{ENV}.py"),  # loads dev.py, prod.py or test.py automatically
 )
@@ -48,6 +48,23 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
 CLOUDMERSIVE_API_KEY = os.getenv("CLOUDMERSIVE_API_KEY", "")
 CLOUDMERSIVE_SCAN_ENABLED = True   # you can turn it off in development
 
+# ========= CACHE ==========
+# Shared Redis cache for LLM responses; falls back to per-process memory when REDIS_URL is unset
+REDIS_URL = os.getenv("REDIS_URL", "")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 
 
 INSTALLED_APPS = [
@@ -103,6 +120,20 @@ AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
 ]
 
+# Argon2id for new hashes (needs argon2-cffi); set USE_ARGON2_PASSWORD_HASHER the same on every host.
+# All of Django's default hashers stay listed so existing hashes verify and get upgraded on login.
+USE_ARGON2_PASSWORD_HASHER = os.getenv("USE_ARGON2_PASSWORD_HASHER", "True").lower() in ("true", "1", "yes")
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+if USE_ARGON2_PASSWORD_HASHER:
+    PASSWORD_HASHERS.remove("django.contrib.auth.hashers.Argon2PasswordHasher")
+    PASSWORD_HASHERS.insert(0, "django.contrib.auth.hashers.Argon2PasswordHasher")
+
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
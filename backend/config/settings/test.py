@@ -0,0 +1,25 @@
+"""
+Test settings
+Selected automatically under `manage.py test` or pytest; an explicit DJANGO_ENV always wins.
+"""
+from .base import *
+
+# Cheap hasher: tests create many users and never need real password security
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# Pinned to in-memory SQLite so tests never run against a Postgres base config
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        # Build the test schema straight from models; data/RunSQL migrations are skipped
+        "TEST": {"NAME": ":memory:", "MIGRATE": False},
+    }
+}
+
+# Per-process cache so a developer's REDIS_URL never shares throttle counters or 2FA codes with tests
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
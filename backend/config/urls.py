@@ -33,20 +33,24 @@ schema_view = get_schema_view(
     permission_classes=(permissions.AllowAny,),
 )
 
+# Versioned API Routes (grouped so the resolver matches the "api/v1/" prefix once)
+api_v1_patterns = [
+    path("", include("apps.common.urls")),
+    path("", include("apps.users.urls")),
+    path("", include("apps.patients.urls")),
+    path("", include("apps.cases.urls")),
+    path("", include("apps.documents.urls")),
+    path("", include("apps.ai.urls")),
+    path("", include("apps.recommendation.urls")),
+    path("", include("apps.activities.urls")),
+    path("", include("apps.dashboard.urls")),
+    path("", include("apps.notifications.urls")),
+]
+
 urlpatterns = [
     path("admin/", admin.site.urls),
 
-    # Versioned API Routes
-    path("api/v1/", include("apps.common.urls")),
-    path("api/v1/", include("apps.users.urls")),
-    path("api/v1/", include("apps.patients.urls")), 
-    path("api/v1/", include("apps.cases.urls")),
-    path("api/v1/", include("apps.documents.urls")),
-    path('api/v1/', include('apps.ai.urls')),
-    path('api/v1/', include('apps.recommendation.urls')),
-    path('api/v1/', include('apps.activities.urls')),
-    path('api/v1/', include('apps.dashboard.urls')),
-    path('api/v1/', include('apps.notifications.urls')),
+    path("api/v1/", include(api_v1_patterns)),
 
     # Global Auth Routes
     path("api/login/", TokenObtainPairView.as_view(), name="jwt-login"),